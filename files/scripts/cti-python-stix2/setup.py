@@ -47,7 +47,6 @@ setup(
     packages=find_packages(exclude=['*.test', '*.test.*']),
     python_requires='>=3.7',
     install_requires=[
-        'pytz',
         'requests',
         'simplejson',
         'stix2-patterns>=1.2.0',
@@ -60,5 +59,6 @@ setup(
     extras_require={
         'taxii': ['taxii2-client>=2.3.0'],
         'semantic': ['haversine', 'rapidfuzz'],
+        'orjson': ['orjson'],
     },
 )
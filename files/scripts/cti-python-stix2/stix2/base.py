@@ -33,6 +33,20 @@ def get_required_properties(properties):
     return (k for k, v in properties.items() if v.required)
 
 
+def _get_property_info(properties):
+    """Return the names of the required properties in ``properties``, and
+    the (name, property) pairs of those which might be set to a default
+    value that is left out of serialization.
+    """
+    required = frozenset(get_required_properties(properties))
+    defaultable = tuple(
+        (name, prop) for name, prop in properties.items()
+        if not prop.required and not hasattr(prop, '_fixed_value') and
+        hasattr(prop, 'default')
+    )
+    return required, defaultable
+
+
 class _STIXBase(collections.abc.Mapping):
     """Base class for STIX object types"""
 
@@ -113,6 +127,20 @@ class _STIXBase(collections.abc.Mapping):
         for m in self.get('granular_markings', []):
             validate(self, m.get('selectors'))
 
+    @classmethod
+    def _class_property_info(cls):
+        """Return _get_property_info() for this class's _properties.
+
+        This is computed once per class and stored on it. The properties it
+        was computed from are stored alongside, so that a class whose
+        _properties is replaced gets fresh info.
+        """
+        info = cls.__dict__.get('_property_info')
+        if info is None or info[0] is not cls._properties:
+            info = (cls._properties,) + _get_property_info(cls._properties)
+            cls._property_info = info
+        return info[1], info[2]
+
     def __init__(self, allow_custom=False, interoperability=False, **kwargs):
         cls = self.__class__
 
@@ -182,12 +210,19 @@ class _STIXBase(collections.abc.Mapping):
 
         # defined_properties = all properties defined on this type, plus all
         # properties defined on this instance as a result of toplevel property
-        # extensions.
-        defined_properties = collections.ChainMap(
-            self._properties, registered_toplevel_extension_props,
-        )
+        # extensions.  ChainMap lookups are comparatively slow, so only chain
+        # when there is something to chain with (the uncommon case).
+        if registered_toplevel_extension_props:
+            defined_properties = collections.ChainMap(
+                self._properties, registered_toplevel_extension_props,
+            )
+        else:
+            defined_properties = self._properties
 
-        assigned_properties = collections.ChainMap(kwargs, custom_props)
+        if custom_props:
+            assigned_properties = collections.ChainMap(kwargs, custom_props)
+        else:
+            assigned_properties = kwargs
 
         # Establish property order: spec-defined, toplevel extension, custom.
         toplevel_extension_props = registered_toplevel_extension_props.keys() \
@@ -215,22 +250,31 @@ class _STIXBase(collections.abc.Mapping):
 
                 has_custom = has_custom or temp_custom
 
+        if self._properties is cls._properties:
+            required_properties, defaultable = cls._class_property_info()
+        else:
+            # Properties overridden on the instance
+            required_properties, defaultable = _get_property_info(self._properties)
+        if registered_toplevel_extension_props:
+            # As in defined_properties, this type's own definitions win.
+            ext_required, ext_defaultable = _get_property_info({
+                name: prop
+                for name, prop in registered_toplevel_extension_props.items()
+                if name not in self._properties
+            })
+            required_properties = required_properties | ext_required
+            defaultable = defaultable + ext_defaultable
+
         # Detect any missing required properties
-        required_properties = set(
-            get_required_properties(defined_properties),
-        )
         missing_kwargs = required_properties - setting_kwargs.keys()
         if missing_kwargs:
             raise MissingPropertiesError(cls, missing_kwargs)
 
         # Cache defaulted optional properties for serialization
         defaulted = []
-        for name, prop in defined_properties.items():
+        for name, prop in defaultable:
             try:
-                if (
-                    not prop.required and not hasattr(prop, '_fixed_value') and
-                    prop.default() == setting_kwargs[name]
-                ):
+                if prop.default() == setting_kwargs[name]:
                     defaulted.append(name)
             except (AttributeError, KeyError):
                 continue
@@ -317,10 +361,18 @@ class _STIXBase(collections.abc.Mapping):
     def revoke(self):
         return _revoke(self)
 
-    def serialize(self, *args, **kwargs):
+    def serialize(self, pretty=False, include_optional_defaults=False, **kwargs):
         """
         Serialize a STIX object.
 
+        The output for a given ``pretty`` / ``include_optional_defaults``
+        combination is cached on the instance and reused by later calls.
+        Calls passing any other ``json.dumps()`` arguments are not cached.
+        STIX properties can't be reassigned, but lists and dicts held in them
+        can still be changed in place; doing so after the object has been
+        serialized is not supported, and the cached output won't reflect it.
+        Use ``new_version()`` to get a changed object instead.
+
         Examples:
             >>> import stix2
             >>> identity = stix2.Identity(name='Example Corp.', identity_class='organization')
@@ -342,7 +394,16 @@ class _STIXBase(collections.abc.Mapping):
         See Also:
             ``stix2.serialization.serialize`` for options.
         """
-        return serialize(self, *args, **kwargs)
+        if kwargs:
+            return serialize(self, pretty, include_optional_defaults, **kwargs)
+
+        key = (pretty, include_optional_defaults)
+        cache = self.__dict__.setdefault('_serialize_cache', {})
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = serialize(self, pretty, include_optional_defaults)
+            return result
 
     def fp_serialize(self, *args, **kwargs):
         """
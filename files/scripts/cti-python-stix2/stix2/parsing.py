@@ -1,17 +1,49 @@
 """STIX2 Core parsing methods."""
 
 import copy
+import re
 
 from . import registry
 from .exceptions import ParseError
 from .utils import _get_dict, detect_spec_version
 
+# A "type" key with a string value; any JSON text for a STIX object has one.
+_QUICK_TYPE_REGEX = re.compile(r'"type"\s*:\s*"')
+_QUICK_TYPE_REGEX_BYTES = re.compile(rb'"type"\s*:\s*"')
 
-def parse(data, allow_custom=False, interoperability=False, version=None):
+
+def quickcheck(data):
+    """Cheaply screen JSON text before parsing it as a STIX object.
+
+    This only scans the raw text for a ``"type"`` key with a string value,
+    which every serialized STIX object has. It does not decode the JSON, so
+    text that passes may still fail to parse.
+
+    Args:
+        data (str, bytes): The JSON text to check. Any other kind of input
+            is not checked and passes.
+
+    Returns:
+        bool: False if `data` cannot be a STIX object, True otherwise.
+
+    """
+    data_type = type(data)
+    if data_type is dict:
+        return True
+    if data_type is str or isinstance(data, str):
+        return _QUICK_TYPE_REGEX.search(data) is not None
+    if data_type is bytes or isinstance(data, (bytes, bytearray)):
+        return _QUICK_TYPE_REGEX_BYTES.search(data) is not None
+    return True
+
+
+def parse(data, allow_custom=False, interoperability=False, version=None, quick=False):
     """Convert a string, dict or file-like object into a STIX object.
 
     Args:
-        data (str, dict, file-like object): The STIX 2 content to be parsed.
+        data (str, bytes, dict, file-like object): The STIX 2 content to be
+            parsed. A dict is used as is; JSON text, including UTF-8 bytes,
+            is decoded directly.
         allow_custom (bool): Whether to allow custom properties as well unknown
             custom objects. Note that unknown custom objects cannot be parsed
             into STIX objects, and will be returned as is. Default: False.
@@ -19,6 +51,9 @@ def parse(data, allow_custom=False, interoperability=False, version=None):
             provided. Otherwise, the library will make the best effort based
             on checking the "spec_version" property. If none of the above are
             possible, it will use the default version specified by the library.
+        quick (bool): If True, JSON text is first screened with
+            :func:`quickcheck` so that text which cannot hold a STIX object
+            is rejected without being decoded. Default: False.
 
     Returns:
         An instantiated Python STIX object.
@@ -33,6 +68,9 @@ def parse(data, allow_custom=False, interoperability=False, version=None):
         I don't know about ahead of time)
 
     """
+    if quick and not quickcheck(data):
+        raise ParseError("Can't parse object with no 'type' property: %s" % str(data))
+
     # convert STIX object to dict, if not already
     obj = _get_dict(data)
 
@@ -26,6 +26,15 @@ ID_REGEX_interoperability = re.compile(
 )
 TYPE_REGEX = re.compile(r'^-?[a-z0-9]+(-[a-z0-9]+)*-?$')
 TYPE_21_REGEX = re.compile(r'^([a-z][a-z0-9]*)+([a-z0-9-]+)*-?$')
+# Canonical (lowercase or uppercase, hyphenated) UUID forms accepted outright
+# by IDProperty; the third group pins the version nibble where required and
+# the fourth the RFC 4122 variant.
+_UUID_21_PATTERN = (
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}"
+)
+_UUID_20_PATTERN = (
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-4[0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}"
+)
 ERROR_INVALID_ID = (
     "not a valid STIX identifier, must match <object-type>--<UUID>: {}"
 )
@@ -300,10 +309,17 @@ class IDProperty(Property):
     def __init__(self, type, spec_version=DEFAULT_VERSION):
         self.required_prefix = type + "--"
         self.spec_version = spec_version
+        uuid_pattern = _UUID_20_PATTERN if spec_version == "2.0" else _UUID_21_PATTERN
+        # Well-formed identifiers are accepted with a single regex match;
+        # anything else goes through _validate_id for the detailed error.
+        self._id_match = re.compile(
+            re.escape(self.required_prefix) + uuid_pattern,
+        ).fullmatch
         super(IDProperty, self).__init__()
 
     def clean(self, value, allow_custom=False, interoperability=False):
-        _validate_id(value, self.spec_version, self.required_prefix, interoperability)
+        if not (isinstance(value, str) and self._id_match(value)):
+            _validate_id(value, self.spec_version, self.required_prefix, interoperability)
         return value, False
 
     def default(self):
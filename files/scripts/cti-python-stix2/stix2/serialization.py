@@ -105,8 +105,17 @@ def fp_serialize(obj, fp, pretty=False, include_optional_defaults=False, **kwarg
         overridden: indent=4, separators=(",", ": "), item_sort_key=sort_by.
     """
     if pretty:
+        indices = _property_indices(obj)
+
         def sort_by(element):
-            return find_property_index(obj, *element)
+            key, value = element
+            if key.isdigit():
+                return int(key)
+            try:
+                return indices[element]
+            except (KeyError, TypeError):
+                # Unhashable value: search for it
+                return find_property_index(obj, key, value)
 
         kwargs.update({'indent': 4, 'separators': (',', ': '), 'item_sort_key': sort_by})
 
@@ -156,6 +165,50 @@ def _find_property_in_seq(seq, search_key, search_value):
     return idx
 
 
+def _property_indices(obj):
+    """
+    Precompute find_property_index() for every property of ``obj`` and of the
+    objects, dicts and lists nested in it.
+
+    find_property_index() returns the index found in the first object, in
+    depth-first pre-order, holding an equal value under the key. Walking the
+    tree once in that order gives the same answers in a single pass, instead
+    of searching the whole tree for every property being serialized. Only
+    (key, value) pairs with a hashable value can be recorded.
+
+    Args:
+        obj: The object to index (list, dict, or stix object)
+
+    Returns:
+        dict: Maps (key, value) tuples to indices
+    """
+    indices = {}
+
+    def walk(node):
+        if isinstance(node, stix2.base._STIXBase):
+            keys = list(node)
+        elif isinstance(node, dict):
+            keys = sorted(node)
+        elif isinstance(node, list):
+            for elem in node:
+                walk(elem)
+            return
+        else:
+            return
+
+        for idx, key in enumerate(keys):
+            try:
+                indices.setdefault((key, node[key]), idx)
+            except TypeError:
+                pass
+
+        for value in node.values():
+            walk(value)
+
+    walk(obj)
+    return indices
+
+
 def find_property_index(obj, search_key, search_value):
     """
     Search (recursively) for the given key and value in the given object.
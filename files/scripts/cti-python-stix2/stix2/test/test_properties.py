@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 from stix2.base import _STIXBase
 from stix2.exceptions import (
@@ -315,7 +314,7 @@ def test_boolean_property_invalid(value):
 )
 def test_timestamp_property_valid(value):
     ts_prop = TimestampProperty()
-    assert ts_prop.clean(value) == (dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc), False)
+    assert ts_prop.clean(value) == (dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc), False)
 
 
 def test_timestamp_property_invalid():
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 import stix2.exceptions
@@ -64,8 +63,8 @@ def test_parse_attack_pattern(data):
 
     assert ap.type == 'attack-pattern'
     assert ap.id == ATTACK_PATTERN_ID
-    assert ap.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
-    assert ap.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    assert ap.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
+    assert ap.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
     assert ap.description == "..."
     assert ap.external_references[0].external_id == 'CAPEC-163'
     assert ap.external_references[0].source_name == 'capec'
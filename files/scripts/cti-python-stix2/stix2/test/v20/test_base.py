@@ -2,13 +2,12 @@ import datetime as dt
 import json
 
 import pytest
-import pytz
 
 from stix2.base import STIXJSONEncoder
 
 
 def test_encode_json_datetime():
-    now = dt.datetime(2017, 3, 22, 0, 0, 0, tzinfo=pytz.UTC)
+    now = dt.datetime(2017, 3, 22, 0, 0, 0, tzinfo=dt.timezone.utc)
     test_dict = {'now': now}
 
     expected = '{"now": "2017-03-22T00:00:00Z"}'
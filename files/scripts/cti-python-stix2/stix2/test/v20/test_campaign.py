@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -43,8 +42,8 @@ def test_parse_campaign(data):
 
     assert cmpn.type == 'campaign'
     assert cmpn.id == CAMPAIGN_ID
-    assert cmpn.created == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=pytz.utc)
-    assert cmpn.modified == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=pytz.utc)
+    assert cmpn.created == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=dt.timezone.utc)
+    assert cmpn.modified == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=dt.timezone.utc)
     assert cmpn.created_by_ref == IDENTITY_ID
     assert cmpn.description == "Campaign by Green Group against a series of targets in the financial services sector."
     assert cmpn.name == "Green Group Attacks Against Finance"
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -50,8 +49,8 @@ def test_parse_course_of_action(data):
 
     assert coa.type == 'course-of-action'
     assert coa.id == COURSE_OF_ACTION_ID
-    assert coa.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
-    assert coa.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
+    assert coa.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
+    assert coa.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
     assert coa.created_by_ref == IDENTITY_ID
     assert coa.description == "This is how to add a filter rule to block inbound access to TCP port 80 to the existing UDP 1434 filter ..."
     assert coa.name == "Add TCP port 80 Filter Rule to the existing Block UDP 1434 Filter"
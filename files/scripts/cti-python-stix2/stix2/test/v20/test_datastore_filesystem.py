@@ -6,7 +6,6 @@ import shutil
 import stat
 
 import pytest
-import pytz
 
 import stix2
 from stix2.datastore import DataSourceError
@@ -160,7 +159,7 @@ def test_filesystem_source_get_object(fs_source):
     assert mal.name == "Rover"
     assert mal.modified == datetime.datetime(
         2018, 11, 16, 22, 54, 20, 390000,
-        pytz.utc,
+        datetime.timezone.utc,
     )
 
 
@@ -207,7 +206,7 @@ def test_filesystem_source_query_multiple(fs_source):
 def test_filesystem_source_backward_compatible(fs_source):
     # this specific object is outside an "ID" directory; make sure we can get
     # it.
-    modified = datetime.datetime(2018, 11, 16, 22, 54, 20, 390000, pytz.utc)
+    modified = datetime.datetime(2018, 11, 16, 22, 54, 20, 390000, datetime.timezone.utc)
     results = fs_source.query([
         stix2.Filter("type", "=", "malware"),
         stix2.Filter("id", "=", "malware--6b616fc1-1505-48e3-8b2c-0d19337bff38"),
@@ -1094,7 +1093,7 @@ def test_timestamp2filename_naive():
 
 def test_timestamp2filename_tz():
     # one hour west of UTC (i.e. an hour earlier)
-    tz = pytz.FixedOffset(-60)
+    tz = datetime.timezone(datetime.timedelta(minutes=-60))
     dt = datetime.datetime(
         2010, 6, 15,
         7, 30, 10, 1234,
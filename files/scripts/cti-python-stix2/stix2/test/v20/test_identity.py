@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -47,8 +46,8 @@ def test_parse_identity(data):
 
     assert identity.type == 'identity'
     assert identity.id == IDENTITY_ID
-    assert identity.created == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=pytz.utc)
-    assert identity.modified == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=pytz.utc)
+    assert identity.created == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=dt.timezone.utc)
+    assert identity.modified == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=dt.timezone.utc)
     assert identity.name == "John Smith"
 
 
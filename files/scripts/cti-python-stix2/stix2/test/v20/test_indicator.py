@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 
@@ -35,8 +34,8 @@ EXPECTED_INDICATOR_REPR = "Indicator(" + " ".join(
 
 
 def test_indicator_with_all_required_properties():
-    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
 
     ind = stix2.v20.Indicator(
         type="indicator",
@@ -170,9 +169,9 @@ def test_parse_indicator(data):
 
     assert idctr.type == 'indicator'
     assert idctr.id == INDICATOR_ID
-    assert idctr.created == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    assert idctr.modified == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    assert idctr.valid_from == dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+    assert idctr.created == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    assert idctr.modified == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    assert idctr.valid_from == dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
     assert idctr.labels[0] == "malicious-activity"
     assert idctr.pattern == "[file:hashes.MD5 = 'd41d8cd98f00b204e9800998ecf8427e']"
 
@@ -198,8 +197,8 @@ def test_invalid_indicator_pattern():
 
 
 def test_indicator_stix21_invalid_pattern():
-    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
     patrn = "[EXISTS windows-registry-key:values]"
 
     with pytest.raises(stix2.exceptions.InvalidValueError) as excinfo:
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -68,8 +67,8 @@ def test_parse_intrusion_set(data):
 
     assert intset.type == "intrusion-set"
     assert intset.id == INTRUSION_SET_ID
-    assert intset.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
-    assert intset.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
+    assert intset.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
+    assert intset.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
     assert intset.goals == ["acquisition-theft", "harassment", "damage"]
     assert intset.aliases == ["Zookeeper"]
     assert intset.description == "Incidents usually feature a shared TTP of a bobcat being released..."
@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 
@@ -22,7 +21,7 @@ EXPECTED_MALWARE = """{
 
 
 def test_malware_with_all_required_properties():
-    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
 
     mal = stix2.v20.Malware(
         type="malware",
@@ -37,7 +36,7 @@ def test_malware_with_all_required_properties():
 
 
 def test_malware_with_empty_optional_field():
-    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
 
     mal = stix2.v20.Malware(
         type="malware",
@@ -138,8 +137,8 @@ def test_parse_malware(data):
 
     assert mal.type == 'malware'
     assert mal.id == MALWARE_ID
-    assert mal.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
-    assert mal.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    assert mal.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
+    assert mal.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
     assert mal.labels == ['ransomware']
     assert mal.name == "Cryptolocker"
 
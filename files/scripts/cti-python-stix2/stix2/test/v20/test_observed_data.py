@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 
@@ -190,10 +189,10 @@ def test_parse_observed_data(data):
 
     assert odata.type == 'observed-data'
     assert odata.id == OBSERVED_DATA_ID
-    assert odata.created == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=pytz.utc)
-    assert odata.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=pytz.utc)
-    assert odata.first_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
-    assert odata.last_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
+    assert odata.created == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=dt.timezone.utc)
+    assert odata.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=dt.timezone.utc)
+    assert odata.first_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert odata.last_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
     assert odata.created_by_ref == IDENTITY_ID
     assert odata.objects["0"].type == "file"
 
@@ -640,9 +639,9 @@ def test_directory_example():
     )
 
     assert dir.path == '/usr/lib'
-    assert dir.created == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
-    assert dir.modified == dt.datetime(2015, 12, 24, 19, 0, 0, tzinfo=pytz.utc)
-    assert dir.accessed == dt.datetime(2015, 12, 21, 20, 0, 0, tzinfo=pytz.utc)
+    assert dir.created == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert dir.modified == dt.datetime(2015, 12, 24, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert dir.accessed == dt.datetime(2015, 12, 21, 20, 0, 0, tzinfo=dt.timezone.utc)
     assert dir.contains_refs == ["1"]
 
 
@@ -706,9 +705,9 @@ def test_file_example():
     assert f.magic_number_hex == "1C"
     assert f.hashes["SHA-256"] == "ceafbfd424be2ca4a5f0402cae090dda2fb0526cf521b60b60077c0f622b285a"
     assert f.mime_type == "application/msword"
-    assert f.created == dt.datetime(2016, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
-    assert f.modified == dt.datetime(2016, 12, 24, 19, 0, 0, tzinfo=pytz.utc)
-    assert f.accessed == dt.datetime(2016, 12, 21, 20, 0, 0, tzinfo=pytz.utc)
+    assert f.created == dt.datetime(2016, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert f.modified == dt.datetime(2016, 12, 24, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert f.accessed == dt.datetime(2016, 12, 21, 20, 0, 0, tzinfo=dt.timezone.utc)
     assert f.is_encrypted
     assert f.encryption_algorithm == "AES128-CBC"
     assert f.decryption_key == "fred"   # does the key have a format we can test for?
@@ -1281,10 +1280,10 @@ def test_user_account_example():
     assert not a.is_service_account
     assert not a.is_privileged
     assert a.can_escalate_privs
-    assert a.account_created == dt.datetime(2016, 1, 20, 12, 31, 12, tzinfo=pytz.utc)
-    assert a.password_last_changed == dt.datetime(2016, 1, 20, 14, 27, 43, tzinfo=pytz.utc)
-    assert a.account_first_login == dt.datetime(2016, 1, 20, 14, 26, 7, tzinfo=pytz.utc)
-    assert a.account_last_login == dt.datetime(2016, 7, 22, 16, 8, 28, tzinfo=pytz.utc)
+    assert a.account_created == dt.datetime(2016, 1, 20, 12, 31, 12, tzinfo=dt.timezone.utc)
+    assert a.password_last_changed == dt.datetime(2016, 1, 20, 14, 27, 43, tzinfo=dt.timezone.utc)
+    assert a.account_first_login == dt.datetime(2016, 1, 20, 14, 26, 7, tzinfo=dt.timezone.utc)
+    assert a.account_last_login == dt.datetime(2016, 7, 22, 16, 8, 28, tzinfo=dt.timezone.utc)
 
 
 def test_user_account_unix_account_ext_example():
@@ -1,7 +1,6 @@
 import datetime
 
 import pytest
-import pytz
 
 import stix2
 from stix2.pattern_visitor import create_pattern_object
@@ -499,12 +498,12 @@ def test_invalid_startstop_qualifier():
         (True, stix2.patterns.BooleanConstant, True),
         (
             "2001-02-10T21:36:15Z", stix2.patterns.TimestampConstant,
-            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=pytz.utc),
+            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=datetime.timezone.utc),
         ),
         (
-            datetime.datetime(2001, 2, 10, 21, 36, 15, tzinfo=pytz.utc),
+            datetime.datetime(2001, 2, 10, 21, 36, 15, tzinfo=datetime.timezone.utc),
             stix2.patterns.TimestampConstant,
-            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=pytz.utc),
+            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=datetime.timezone.utc),
         ),
     ],
 )
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -21,7 +20,7 @@ EXPECTED_RELATIONSHIP = """{
 
 
 def test_relationship_all_required_properties():
-    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
 
     rel = stix2.v20.Relationship(
         type='relationship',
@@ -156,8 +155,8 @@ def test_parse_relationship(data):
 
     assert rel.type == 'relationship'
     assert rel.id == RELATIONSHIP_ID
-    assert rel.created == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
-    assert rel.modified == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
+    assert rel.created == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
+    assert rel.modified == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
     assert rel.relationship_type == "indicates"
     assert rel.source_ref == INDICATOR_ID
     assert rel.target_ref == MALWARE_ID
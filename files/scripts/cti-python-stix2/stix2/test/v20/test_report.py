@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 from stix2.exceptions import InvalidValueError
@@ -121,8 +120,8 @@ def test_parse_report(data):
 
     assert rept.type == 'report'
     assert rept.id == REPORT_ID
-    assert rept.created == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=pytz.utc)
-    assert rept.modified == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=pytz.utc)
+    assert rept.created == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=dt.timezone.utc)
+    assert rept.modified == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=dt.timezone.utc)
     assert rept.created_by_ref == IDENTITY_ID
     assert rept.object_refs == [
         INDICATOR_ID,
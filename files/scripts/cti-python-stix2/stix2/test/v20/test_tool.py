@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -65,8 +64,8 @@ def test_parse_tool(data):
 
     assert tool.type == 'tool'
     assert tool.id == TOOL_ID
-    assert tool.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
-    assert tool.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
+    assert tool.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
+    assert tool.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
     assert tool.created_by_ref == IDENTITY_ID
     assert tool.labels == ["remote-access"]
     assert tool.name == "VNC"
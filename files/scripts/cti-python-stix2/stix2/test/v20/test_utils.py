@@ -2,6 +2,7 @@
 
 import datetime as dt
 from io import StringIO
+import math
 
 import pytest
 import pytz
@@ -17,7 +18,7 @@ eastern = pytz.timezone('US/Eastern')
 
 @pytest.mark.parametrize(
     'dttm, timestamp', [
-        (dt.datetime(2017, 1, 1, tzinfo=pytz.utc), '2017-01-01T00:00:00Z'),
+        (dt.datetime(2017, 1, 1, tzinfo=dt.timezone.utc), '2017-01-01T00:00:00Z'),
         (amsterdam.localize(dt.datetime(2017, 1, 1)), '2016-12-31T23:00:00Z'),
         (eastern.localize(dt.datetime(2017, 1, 1, 12, 34, 56)), '2017-01-01T17:34:56Z'),
         (eastern.localize(dt.datetime(2017, 7, 1)), '2017-07-01T04:00:00Z'),
@@ -33,9 +34,9 @@ def test_timestamp_formatting(dttm, timestamp):
 
 @pytest.mark.parametrize(
     'timestamp, dttm', [
-        (dt.datetime(2017, 1, 1, 0, tzinfo=pytz.utc), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=pytz.utc)),
-        (dt.date(2017, 1, 1), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=pytz.utc)),
-        ('2017-01-01T00:00:00Z', dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=pytz.utc)),
+        (dt.datetime(2017, 1, 1, 0, tzinfo=dt.timezone.utc), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)),
+        (dt.date(2017, 1, 1), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)),
+        ('2017-01-01T00:00:00Z', dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)),
     ],
 )
 def test_parse_datetime(timestamp, dttm):
@@ -44,11 +45,11 @@ def test_parse_datetime(timestamp, dttm):
 
 @pytest.mark.parametrize(
     'timestamp, dttm, precision', [
-        ('2017-01-01T01:02:03.000001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 0, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 1000, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.1Z', dt.datetime(2017, 1, 1, 1, 2, 3, 100000, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, 450000, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, tzinfo=pytz.utc), 'second'),
+        ('2017-01-01T01:02:03.000001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 0, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 1000, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.1Z', dt.datetime(2017, 1, 1, 1, 2, 3, 100000, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, 450000, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, tzinfo=dt.timezone.utc), 'second'),
     ],
 )
 def test_parse_datetime_precision(timestamp, dttm, precision):
@@ -70,6 +71,7 @@ def test_parse_datetime_invalid(ts):
     'data', [
         {"a": 1},
         '{"a": 1}',
+        b'{"a": 1}',
         StringIO(u'{"a": 1}'),
         [("a", 1)],
     ],
@@ -91,6 +93,11 @@ def test_get_dict_invalid(data):
         stix2.utils._get_dict(data)
 
 
+def test_get_dict_nan():
+    # Not strict JSON, but accepted by the stdlib decoder
+    assert math.isnan(stix2.utils._get_dict('{"a": NaN}')["a"])
+
+
 @pytest.mark.parametrize(
     'stix_id, type', [
         ('malware--d69c8146-ab35-4d50-8382-6fc80e641d43', 'malware'),
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -62,8 +61,8 @@ def test_parse_vulnerability(data):
 
     assert vuln.type == 'vulnerability'
     assert vuln.id == VULNERABILITY_ID
-    assert vuln.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
-    assert vuln.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    assert vuln.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
+    assert vuln.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
     assert vuln.name == "CVE-2016-1234"
     assert vuln.external_references[0].external_id == "CVE-2016-1234"
     assert vuln.external_references[0].source_name == "cve"
@@ -1,8 +1,6 @@
 import datetime as dt
 
-import pytz
-
-FAKE_TIME = dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
+FAKE_TIME = dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
 
 ATTACK_PATTERN_ID = "attack-pattern--0c7b5b88-8ff7-4a4d-aa9d-feb398cd0061"
 CAMPAIGN_ID = "campaign--8e2e2d2b-17d4-4cbf-938f-98ee46b3cd3f"
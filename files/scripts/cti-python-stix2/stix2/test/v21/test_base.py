@@ -3,14 +3,13 @@ import json
 import uuid
 
 import pytest
-import pytz
 
 import stix2
 from stix2.base import STIXJSONEncoder
 
 
 def test_encode_json_datetime():
-    now = dt.datetime(2017, 3, 22, 0, 0, 0, tzinfo=pytz.UTC)
+    now = dt.datetime(2017, 3, 22, 0, 0, 0, tzinfo=dt.timezone.utc)
     test_dict = {'now': now}
 
     expected = '{"now": "2017-03-22T00:00:00Z"}'
@@ -36,3 +35,36 @@ def test_deterministic_id_unicode():
 
     assert id_uuid.variant == uuid.RFC_4122
     assert id_uuid.version == 5
+
+
+def test_serialize_cached():
+    identity = stix2.v21.Identity(name="alice", identity_class="individual")
+
+    pretty = identity.serialize(pretty=True)
+    assert identity.serialize(pretty=True) is pretty
+    assert identity.serialize() is not pretty
+    assert identity.serialize() == str(identity)
+    assert identity.serialize(sort_keys=True) == json.dumps(json.loads(identity.serialize()), sort_keys=True)
+
+
+def test_serialize_cached_ignores_nested_mutation():
+    # Mutating nested containers after serializing is unsupported; the
+    # cached output is returned unchanged.
+    grouping = stix2.v21.Grouping(
+        context="suspicious-activity",
+        object_refs=["identity--311b2d2d-f010-4473-83ec-1edf84858f4c"],
+    )
+    serialized = grouping.serialize()
+    grouping.object_refs.append("identity--988145ed-a3b4-4421-b7a7-273376be67ce")
+
+    assert grouping.serialize() is serialized
+    assert "988145ed" not in grouping.serialize()
+    assert "988145ed" in grouping.serialize(sort_keys=False)
+
+
+def test_class_property_info():
+    required, defaultable = stix2.v21.Grouping._class_property_info()
+
+    assert required == {"context", "object_refs"}
+    assert "revoked" in dict(defaultable)
+    assert stix2.v21.Grouping._class_property_info()[0] is required
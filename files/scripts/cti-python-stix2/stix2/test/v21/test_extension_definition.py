@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -64,8 +63,8 @@ def test_parse_extension_definition(data):
     assert extension_definition.type == 'extension-definition'
     assert extension_definition.spec_version == '2.1'
     assert extension_definition.id == EXTENSION_DEFINITION_IDS[0]
-    assert extension_definition.created == dt.datetime(2014, 2, 20, 9, 16, 8, tzinfo=pytz.utc)
-    assert extension_definition.modified == dt.datetime(2014, 2, 20, 9, 16, 8, tzinfo=pytz.utc)
+    assert extension_definition.created == dt.datetime(2014, 2, 20, 9, 16, 8, tzinfo=dt.timezone.utc)
+    assert extension_definition.modified == dt.datetime(2014, 2, 20, 9, 16, 8, tzinfo=dt.timezone.utc)
     assert extension_definition.name == 'New SDO 1'
     assert extension_definition.description == 'This schema creates a new object type called my-favorite-sdo-1'
     assert extension_definition.schema == 'https://www.example.com/schema-my-favorite-sdo-1/v1/'
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -23,7 +22,7 @@ EXPECTED_GROUPING = """{
 
 
 def test_grouping_with_all_required_properties():
-    now = dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
 
     grp = stix2.v21.Grouping(
         type="grouping",
@@ -97,6 +96,7 @@ def test_invalid_kwarg_to_grouping():
 @pytest.mark.parametrize(
     "data", [
         EXPECTED_GROUPING,
+        EXPECTED_GROUPING.encode("utf-8"),
         {
             "type": "grouping",
             "spec_version": "2.1",
@@ -114,12 +114,13 @@ def test_invalid_kwarg_to_grouping():
 )
 def test_parse_grouping(data):
     grp = stix2.parse(data)
+    assert stix2.parse(data, quick=True) == grp
 
     assert grp.type == 'grouping'
     assert grp.spec_version == '2.1'
     assert grp.id == GROUPING_ID
-    assert grp.created == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
-    assert grp.modified == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
+    assert grp.created == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
+    assert grp.modified == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
     assert grp.name == "Harry Potter and the Leet Hackers"
     assert grp.context == "suspicious-activity"
     assert grp.object_refs == [
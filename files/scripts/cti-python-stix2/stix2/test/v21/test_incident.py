@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -50,8 +49,8 @@ def test_parse_incident(data):
     assert incident.type == 'incident'
     assert incident.spec_version == '2.1'
     assert incident.id == INCIDENT_ID
-    assert incident.created == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=pytz.utc)
-    assert incident.modified == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=pytz.utc)
+    assert incident.created == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=dt.timezone.utc)
+    assert incident.modified == dt.datetime(2015, 12, 21, 19, 59, 11, tzinfo=dt.timezone.utc)
     assert incident.name == 'Breach of Cyber Tech Dynamics'
     assert incident.description == 'Intrusion into enterprise network'
 
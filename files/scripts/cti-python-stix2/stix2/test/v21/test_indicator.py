@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 
@@ -37,8 +36,8 @@ EXPECTED_INDICATOR_REPR = "Indicator(" + " ".join(
 
 
 def test_indicator_with_all_required_properties():
-    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
 
     ind = stix2.v21.Indicator(
         type="indicator",
@@ -173,9 +172,9 @@ def test_parse_indicator(data):
     assert idctr.type == 'indicator'
     assert idctr.spec_version == '2.1'
     assert idctr.id == INDICATOR_ID
-    assert idctr.created == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    assert idctr.modified == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    assert idctr.valid_from == dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+    assert idctr.created == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    assert idctr.modified == dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    assert idctr.valid_from == dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
     assert idctr.pattern == "[file:hashes.MD5 = 'd41d8cd98f00b204e9800998ecf8427e']"
 
 
@@ -204,8 +203,8 @@ def test_invalid_indicator_pattern():
 
 
 def test_indicator_with_custom_embedded_objs():
-    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
 
     ext_ref = stix2.v21.ExternalReference(
         source_name="Test",
@@ -249,8 +248,8 @@ def test_indicator_with_custom_embed_objs_extra_props_error():
 
 
 def test_indicator_stix20_invalid_pattern():
-    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
-    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
+    epoch = dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=dt.timezone.utc)
     patrn = "[win-registry-key:key = 'hkey_local_machine\\\\foo\\\\bar'] WITHIN 5 SECONDS WITHIN 6 SECONDS"
 
     with pytest.raises(stix2.exceptions.InvalidValueError) as excinfo:
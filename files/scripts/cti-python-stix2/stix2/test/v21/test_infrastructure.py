@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -18,7 +17,7 @@ EXPECTED_INFRASTRUCTURE = """{
 
 
 def test_infrastructure_with_all_required_properties():
-    now = dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
 
     infra = stix2.v21.Infrastructure(
         type="infrastructure",
@@ -111,8 +110,8 @@ def test_parse_infrastructure(data):
     assert infra.type == 'infrastructure'
     assert infra.spec_version == '2.1'
     assert infra.id == INFRASTRUCTURE_ID
-    assert infra.created == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
-    assert infra.modified == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
+    assert infra.created == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
+    assert infra.modified == dt.datetime(2017, 1, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
     assert infra.name == 'Poison Ivy C2'
 
 
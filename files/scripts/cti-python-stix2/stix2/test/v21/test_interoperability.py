@@ -1,10 +1,8 @@
 import datetime
 
-import pytz
-
 import stix2
 
-FAKE_TIME = datetime.datetime(2017, 1, 1, 12, 34, 56, tzinfo=pytz.utc)
+FAKE_TIME = datetime.datetime(2017, 1, 1, 12, 34, 56, tzinfo=datetime.timezone.utc)
 
 ATTACK_PATTERN_ID = "attack-pattern--168b3330-fc69-11e8-b98e-0800279d6dc6"
 BUNDLE_ID = "bundle--2acecf31-5262-3981-8eff-db8a1de5945b"
@@ -2,8 +2,6 @@
 
 import datetime as dt
 
-import pytz
-
 import stix2
 
 CAMPAIGN_ID = "campaign--12a111f0-b824-4baf-a224-83b80237a094"
@@ -43,7 +41,7 @@ TEST_LANGUAGE_CONTENT = u"""{
 
 
 def test_language_content_campaign():
-    now = dt.datetime(2017, 2, 8, 21, 31, 22, microsecond=7000, tzinfo=pytz.utc)
+    now = dt.datetime(2017, 2, 8, 21, 31, 22, microsecond=7000, tzinfo=dt.timezone.utc)
 
     lc = stix2.v21.LanguageContent(
         type='language-content',
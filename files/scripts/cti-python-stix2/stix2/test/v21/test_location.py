@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 import stix2.exceptions
@@ -54,7 +53,7 @@ EXPECTED_LOCATION_2_REPR = "Location(" + " ".join(
 
 
 def test_location_with_some_required_properties():
-    now = dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=dt.timezone.utc)
 
     location = stix2.v21.Location(
         id=LOCATION_ID,
@@ -88,8 +87,8 @@ def test_parse_location(data):
     assert location.type == 'location'
     assert location.spec_version == '2.1'
     assert location.id == LOCATION_ID
-    assert location.created == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=pytz.utc)
-    assert location.modified == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=pytz.utc)
+    assert location.created == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=dt.timezone.utc)
+    assert location.modified == dt.datetime(2016, 4, 6, 20, 3, 0, tzinfo=dt.timezone.utc)
     assert location.region == 'northern-america'
     rep = re.sub(r"(\[|=| )u('|\"|\\\'|\\\")", r"\g<1>\g<2>", repr(location))
     assert rep == EXPECTED_LOCATION_2_REPR
@@ -294,7 +293,7 @@ def test_google_map_url_long_lat_provided():
 
 def test_google_map_url_multiple_props_no_long_lat_provided():
     expected_url = "https://www.google.com/maps/search/?api=1&query=1410+Museum+Campus+Drive%2C+Chicago%2C+IL+60605%2CUnited+States+of+America%2CNorth+America"
-    now = dt.datetime(2019, 2, 7, 12, 34, 56, tzinfo=pytz.utc)
+    now = dt.datetime(2019, 2, 7, 12, 34, 56, tzinfo=dt.timezone.utc)
 
     loc = stix2.v21.Location(
         type="location",
@@ -2,7 +2,6 @@ import datetime as dt
 import json
 
 import pytest
-import pytz
 
 import stix2
 
@@ -21,7 +20,7 @@ EXPECTED_MALWARE = """{
 
 
 def test_malware_with_all_required_properties():
-    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
 
     malware = stix2.v21.Malware(
         type="malware",
@@ -123,8 +122,8 @@ def test_parse_malware(data):
     assert mal.type == 'malware'
     assert mal.spec_version == '2.1'
     assert mal.id == MALWARE_ID
-    assert mal.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
-    assert mal.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    assert mal.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
+    assert mal.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
     assert mal.name == 'Cryptolocker'
     assert not mal.is_family
 
@@ -3,7 +3,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 from stix2.v21 import TLP_WHITE
@@ -209,7 +208,7 @@ def test_parse_marking_definition(data):
     assert gm.type == 'marking-definition'
     assert gm.spec_version == '2.1'
     assert gm.id == MARKING_DEFINITION_ID
-    assert gm.created == dt.datetime(2017, 1, 20, 0, 0, 0, tzinfo=pytz.utc)
+    assert gm.created == dt.datetime(2017, 1, 20, 0, 0, 0, tzinfo=dt.timezone.utc)
     assert gm.definition.tlp == "white"
     assert gm.definition_type == "tlp"
 
@@ -238,7 +237,7 @@ def test_registered_custom_marking():
 
     assert marking_def.type == "marking-definition"
     assert marking_def.id == "marking-definition--00000000-0000-4000-8000-000000000012"
-    assert marking_def.created == dt.datetime(2017, 1, 22, 0, 0, 0, tzinfo=pytz.utc)
+    assert marking_def.created == dt.datetime(2017, 1, 22, 0, 0, 0, tzinfo=dt.timezone.utc)
     assert marking_def.definition.property1 == "something"
     assert marking_def.definition.property2 == 55
     assert marking_def.definition_type == "x-new-marking-type"
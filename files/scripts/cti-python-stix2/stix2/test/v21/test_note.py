@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 
@@ -55,7 +54,7 @@ EXPECTED_OPINION_REPR = "Note(" + " ".join((
 
 
 def test_note_with_required_properties():
-    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
 
     note = stix2.v21.Note(
         type='note',
@@ -111,8 +110,8 @@ def test_parse_note(data):
     assert note.type == 'note'
     assert note.spec_version == '2.1'
     assert note.id == NOTE_ID
-    assert note.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
-    assert note.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    assert note.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
+    assert note.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
     assert note.object_refs[0] == CAMPAIGN_ID
     assert note.authors[0] == 'John Doe'
     assert note.abstract == 'Tracking Team Note#1'
@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 import stix2.exceptions
@@ -53,8 +52,8 @@ def test_observed_data_example():
 
     assert observed_data.id == "observed-data--b67d30ff-02ac-498a-92f9-32f845f448cf"
     assert observed_data.created_by_ref == "identity--311b2d2d-f010-4473-83ec-1edf84858f4c"
-    assert observed_data.created == observed_data.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=pytz.utc)
-    assert observed_data.first_observed == observed_data.last_observed == dt.datetime(2015, 12, 21, 19, 00, 00, tzinfo=pytz.utc)
+    assert observed_data.created == observed_data.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=dt.timezone.utc)
+    assert observed_data.first_observed == observed_data.last_observed == dt.datetime(2015, 12, 21, 19, 00, 00, tzinfo=dt.timezone.utc)
     assert observed_data.number_observed == 50
     assert observed_data.objects['0'] == stix2.v21.File(name="foo.exe")
 
@@ -114,8 +113,8 @@ def test_observed_data_example_with_refs():
     )
     assert observed_data.id == "observed-data--b67d30ff-02ac-498a-92f9-32f845f448cf"
     assert observed_data.created_by_ref == "identity--311b2d2d-f010-4473-83ec-1edf84858f4c"
-    assert observed_data.created == observed_data.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=pytz.utc)
-    assert observed_data.first_observed == observed_data.last_observed == dt.datetime(2015, 12, 21, 19, 00, 00, tzinfo=pytz.utc)
+    assert observed_data.created == observed_data.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=dt.timezone.utc)
+    assert observed_data.first_observed == observed_data.last_observed == dt.datetime(2015, 12, 21, 19, 00, 00, tzinfo=dt.timezone.utc)
     assert observed_data.number_observed == 50
     assert observed_data.objects['0'] == stix2.v21.File(name="foo.exe")
     assert observed_data.objects['1'] == stix2.v21.Directory(path="/usr/home", contains_refs=["file--5956efbb-a7b0-566d-a7f9-a202eb05c70f"])
@@ -276,10 +275,10 @@ def test_parse_observed_data(data):
     assert odata.type == 'observed-data'
     assert odata.spec_version == '2.1'
     assert odata.id == OBSERVED_DATA_ID
-    assert odata.created == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=pytz.utc)
-    assert odata.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=pytz.utc)
-    assert odata.first_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
-    assert odata.last_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
+    assert odata.created == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=dt.timezone.utc)
+    assert odata.modified == dt.datetime(2016, 4, 6, 19, 58, 16, tzinfo=dt.timezone.utc)
+    assert odata.first_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert odata.last_observed == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
     assert odata.created_by_ref == IDENTITY_ID
     assert odata.objects["0"].type == "file"
 
@@ -717,9 +716,9 @@ def test_directory_example():
     )
 
     assert dir1.path == '/usr/lib'
-    assert dir1.ctime == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
-    assert dir1.mtime == dt.datetime(2015, 12, 24, 19, 0, 0, tzinfo=pytz.utc)
-    assert dir1.atime == dt.datetime(2015, 12, 21, 20, 0, 0, tzinfo=pytz.utc)
+    assert dir1.ctime == dt.datetime(2015, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert dir1.mtime == dt.datetime(2015, 12, 24, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert dir1.atime == dt.datetime(2015, 12, 21, 20, 0, 0, tzinfo=dt.timezone.utc)
     assert dir1.contains_refs == ["file--c6ae2cf8-92d3-56d0-a25f-713efad643a7"]
 
 
@@ -781,9 +780,9 @@ def test_file_example():
     assert f.magic_number_hex == "1C"
     assert f.hashes["SHA-256"] == "ceafbfd424be2ca4a5f0402cae090dda2fb0526cf521b60b60077c0f622b285a"
     assert f.mime_type == "application/msword"
-    assert f.ctime == dt.datetime(2016, 12, 21, 19, 0, 0, tzinfo=pytz.utc)
-    assert f.mtime == dt.datetime(2016, 12, 24, 19, 0, 0, tzinfo=pytz.utc)
-    assert f.atime == dt.datetime(2016, 12, 21, 20, 0, 0, tzinfo=pytz.utc)
+    assert f.ctime == dt.datetime(2016, 12, 21, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert f.mtime == dt.datetime(2016, 12, 24, 19, 0, 0, tzinfo=dt.timezone.utc)
+    assert f.atime == dt.datetime(2016, 12, 21, 20, 0, 0, tzinfo=dt.timezone.utc)
 
 
 def test_file_ssdeep_example():
@@ -1381,10 +1380,10 @@ def test_user_account_example():
     assert not a.is_service_account
     assert not a.is_privileged
     assert a.can_escalate_privs
-    assert a.account_created == dt.datetime(2016, 1, 20, 12, 31, 12, tzinfo=pytz.utc)
-    assert a.credential_last_changed == dt.datetime(2016, 1, 20, 14, 27, 43, tzinfo=pytz.utc)
-    assert a.account_first_login == dt.datetime(2016, 1, 20, 14, 26, 7, tzinfo=pytz.utc)
-    assert a.account_last_login == dt.datetime(2016, 7, 22, 16, 8, 28, tzinfo=pytz.utc)
+    assert a.account_created == dt.datetime(2016, 1, 20, 12, 31, 12, tzinfo=dt.timezone.utc)
+    assert a.credential_last_changed == dt.datetime(2016, 1, 20, 14, 27, 43, tzinfo=dt.timezone.utc)
+    assert a.account_first_login == dt.datetime(2016, 1, 20, 14, 26, 7, tzinfo=dt.timezone.utc)
+    assert a.account_last_login == dt.datetime(2016, 7, 22, 16, 8, 28, tzinfo=dt.timezone.utc)
 
 
 def test_user_account_unix_account_ext_example():
@@ -2,7 +2,6 @@ import datetime as dt
 import re
 
 import pytest
-import pytz
 
 import stix2
 
@@ -45,7 +44,7 @@ EXPECTED_OPINION_REPR = "Opinion(" + " ".join((
 
 
 def test_opinion_with_required_properties():
-    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
 
     opi = stix2.v21.Opinion(
         type='opinion',
@@ -85,8 +84,8 @@ def test_parse_opinion(data):
     assert opinion.type == 'opinion'
     assert opinion.spec_version == '2.1'
     assert opinion.id == OPINION_ID
-    assert opinion.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
-    assert opinion.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=pytz.utc)
+    assert opinion.created == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
+    assert opinion.modified == dt.datetime(2016, 5, 12, 8, 17, 27, tzinfo=dt.timezone.utc)
     assert opinion.opinion == 'strongly-disagree'
     assert opinion.object_refs[0] == 'relationship--16d2358f-3b0d-4c88-b047-0da2f7ed4471'
     assert opinion.explanation == EXPLANATION
@@ -55,6 +55,24 @@ def test_dict_to_stix2_bundle_with_version():
     assert str(excinfo.value) == msg
 
 
+@pytest.mark.parametrize(
+    "data, expected", [
+        ('{"type": "identity", "name": "alice"}', True),
+        (b'{"type":"identity"}', True),
+        ('{"name": "alice", "identity_class": "individual"}', False),
+        (b'[]', False),
+        ({"name": "alice"}, True),
+    ],
+)
+def test_quickcheck(data, expected):
+    assert parsing.quickcheck(data) is expected
+
+
+def test_parse_quick_rejects_untyped_text():
+    with pytest.raises(exceptions.ParseError):
+        parsing.parse('{"name": "alice"}', quick=True)
+
+
 def test_parse_observable_with_version():
     observable = {"type": "file", "name": "foo.exe"}
     obs_obj = parsing.parse_observable(observable, version='2.1')
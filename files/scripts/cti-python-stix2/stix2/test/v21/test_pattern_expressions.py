@@ -1,7 +1,6 @@
 import datetime
 
 import pytest
-import pytz
 from stix2patterns.exceptions import ParseException
 
 import stix2
@@ -647,12 +646,12 @@ def test_invalid_startstop_qualifier():
         (True, stix2.patterns.BooleanConstant, True),
         (
             "2001-02-10T21:36:15Z", stix2.patterns.TimestampConstant,
-            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=pytz.utc),
+            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=datetime.timezone.utc),
         ),
         (
-            datetime.datetime(2001, 2, 10, 21, 36, 15, tzinfo=pytz.utc),
+            datetime.datetime(2001, 2, 10, 21, 36, 15, tzinfo=datetime.timezone.utc),
             stix2.patterns.TimestampConstant,
-            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=pytz.utc),
+            stix2.utils.STIXdatetime(2001, 2, 10, 21, 36, 15, tzinfo=datetime.timezone.utc),
         ),
     ],
 )
@@ -31,6 +31,9 @@ MY_ID = 'my-type--232c9d3f-49fc-4440-bb01-607f638778e7'
     "value", [
         MY_ID,
         'my-type--00000000-0000-4000-8000-000000000000',
+        'my-type--232C9D3F-49FC-4440-BB01-607F638778E7',
+        # Not canonical, but accepted by uuid.UUID
+        'my-type--232c9d3f49fc4440bb01607f638778e7',
     ],
 )
 def test_id_property_valid(value):
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -22,7 +21,7 @@ EXPECTED_RELATIONSHIP = """{
 
 
 def test_relationship_all_required_properties():
-    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
 
     rel = stix2.v21.Relationship(
         type='relationship',
@@ -130,7 +129,7 @@ def test_create_relationship_from_objects_rather_than_ids1(indicator, malware):
     assert rel.source_ref == 'indicator--00000000-0000-4000-8000-000000000001'
     assert rel.target_ref == 'malware--00000000-0000-4000-8000-000000000003'
     assert rel.id == 'relationship--00000000-0000-4000-8000-000000000005'
-    assert rel.stop_time == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
+    assert rel.stop_time == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
 
 
 def test_create_relationship_from_objects_rather_than_ids2(indicator, malware):
@@ -145,7 +144,7 @@ def test_create_relationship_from_objects_rather_than_ids2(indicator, malware):
     assert rel.source_ref == 'indicator--00000000-0000-4000-8000-000000000001'
     assert rel.target_ref == 'malware--00000000-0000-4000-8000-000000000003'
     assert rel.id == 'relationship--00000000-0000-4000-8000-000000000005'
-    assert rel.start_time == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
+    assert rel.start_time == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
 
 
 def test_create_relationship_with_positional_args(indicator, malware):
@@ -178,8 +177,8 @@ def test_parse_relationship(data):
     assert rel.type == 'relationship'
     assert rel.spec_version == '2.1'
     assert rel.id == RELATIONSHIP_ID
-    assert rel.created == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
-    assert rel.modified == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
+    assert rel.created == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
+    assert rel.modified == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
     assert rel.relationship_type == "indicates"
     assert rel.source_ref == INDICATOR_ID
     assert rel.target_ref == MALWARE_ID
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -36,7 +35,7 @@ BAD_SIGHTING = """{
 
 
 def test_sighting_all_required_properties():
-    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
 
     sighting = stix2.v21.Sighting(
         type='sighting',
@@ -50,7 +49,7 @@ def test_sighting_all_required_properties():
 
 
 def test_sighting_bad_where_sighted_refs():
-    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
+    now = dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
 
     with pytest.raises(stix2.exceptions.InvalidValueError) as excinfo:
         stix2.v21.Sighting(
@@ -115,7 +114,7 @@ def test_parse_sighting(data):
     assert sighting.type == 'sighting'
     assert sighting.spec_version == '2.1'
     assert sighting.id == SIGHTING_ID
-    assert sighting.created == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
-    assert sighting.modified == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=pytz.utc)
+    assert sighting.created == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
+    assert sighting.modified == dt.datetime(2016, 4, 6, 20, 6, 37, tzinfo=dt.timezone.utc)
     assert sighting.sighting_of_ref == INDICATOR_ID
     assert sighting.where_sighted_refs == [IDENTITY_ID, LOCATION_ID]
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 import stix2.v21
@@ -61,8 +60,8 @@ def test_parse_threat_actor(data):
     assert actor.type == 'threat-actor'
     assert actor.spec_version == '2.1'
     assert actor.id == THREAT_ACTOR_ID
-    assert actor.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
-    assert actor.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
+    assert actor.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
+    assert actor.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
     assert actor.created_by_ref == IDENTITY_ID
     assert actor.description == "The Evil Org threat actor group"
     assert actor.name == "Evil Org"
@@ -1,7 +1,6 @@
 import datetime as dt
 
 import pytest
-import pytz
 
 import stix2
 
@@ -71,8 +70,8 @@ def test_parse_tool(data):
     assert tool.type == 'tool'
     assert tool.spec_version == '2.1'
     assert tool.id == TOOL_ID
-    assert tool.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
-    assert tool.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=pytz.utc)
+    assert tool.created == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
+    assert tool.modified == dt.datetime(2016, 4, 6, 20, 3, 48, tzinfo=dt.timezone.utc)
     assert tool.created_by_ref == IDENTITY_ID
     assert tool.tool_types == ["remote-access"]
     assert tool.name == "VNC"
@@ -2,6 +2,7 @@
 
 import datetime as dt
 from io import StringIO
+import math
 
 import pytest
 import pytz
@@ -17,7 +18,7 @@ eastern = pytz.timezone('US/Eastern')
 
 @pytest.mark.parametrize(
     'dttm, timestamp', [
-        (dt.datetime(2017, 1, 1, tzinfo=pytz.utc), '2017-01-01T00:00:00Z'),
+        (dt.datetime(2017, 1, 1, tzinfo=dt.timezone.utc), '2017-01-01T00:00:00Z'),
         (amsterdam.localize(dt.datetime(2017, 1, 1)), '2016-12-31T23:00:00Z'),
         (eastern.localize(dt.datetime(2017, 1, 1, 12, 34, 56)), '2017-01-01T17:34:56Z'),
         (eastern.localize(dt.datetime(2017, 7, 1)), '2017-07-01T04:00:00Z'),
@@ -33,9 +34,10 @@ def test_timestamp_formatting(dttm, timestamp):
 
 @pytest.mark.parametrize(
     'timestamp, dttm', [
-        (dt.datetime(2017, 1, 1, 0, tzinfo=pytz.utc), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=pytz.utc)),
-        (dt.date(2017, 1, 1), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=pytz.utc)),
-        ('2017-01-01T00:00:00Z', dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=pytz.utc)),
+        (dt.datetime(2017, 1, 1, 0, tzinfo=dt.timezone.utc), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)),
+        (dt.date(2017, 1, 1), dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)),
+        ('2017-01-01T00:00:00Z', dt.datetime(2017, 1, 1, 0, 0, 0, tzinfo=dt.timezone.utc)),
+        ('2017-01-01T00:00:00.123456Z', dt.datetime(2017, 1, 1, 0, 0, 0, 123456, tzinfo=dt.timezone.utc)),
     ],
 )
 def test_parse_datetime(timestamp, dttm):
@@ -44,11 +46,11 @@ def test_parse_datetime(timestamp, dttm):
 
 @pytest.mark.parametrize(
     'timestamp, dttm, precision', [
-        ('2017-01-01T01:02:03.000001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 0, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 1000, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.1Z', dt.datetime(2017, 1, 1, 1, 2, 3, 100000, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, 450000, tzinfo=pytz.utc), 'millisecond'),
-        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, tzinfo=pytz.utc), 'second'),
+        ('2017-01-01T01:02:03.000001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 0, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.001Z', dt.datetime(2017, 1, 1, 1, 2, 3, 1000, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.1Z', dt.datetime(2017, 1, 1, 1, 2, 3, 100000, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, 450000, tzinfo=dt.timezone.utc), 'millisecond'),
+        ('2017-01-01T01:02:03.45Z', dt.datetime(2017, 1, 1, 1, 2, 3, tzinfo=dt.timezone.utc), 'second'),
     ],
 )
 def test_parse_datetime_precision(timestamp, dttm, precision):
@@ -66,10 +68,32 @@ def test_parse_datetime_invalid(ts):
         stix2.utils.parse_into_datetime('foobar')
 
 
+@pytest.mark.parametrize(
+    'timestamp, precision, constraint, expected', [
+        ('2017-01-01T01:02:03.123Z', 'millisecond', 'min', '2017-01-01T01:02:03.123Z'),
+        ('2017-01-01T01:02:03.123456Z', 'millisecond', 'min', '2017-01-01T01:02:03.123456Z'),
+        ('2017-01-01T01:02:03Z', 'millisecond', 'min', '2017-01-01T01:02:03.000Z'),
+        ('2017-01-01T01:02:03.123450Z', 'millisecond', 'min', '2017-01-01T01:02:03.12345Z'),
+        ('2017-01-01T01:02:03.123456Z', 'millisecond', 'exact', '2017-01-01T01:02:03.123Z'),
+        ('2017-01-01T01:02:03.100Z', 'any', 'exact', '2017-01-01T01:02:03.1Z'),
+        ('2017-01-01T01:02:03.100Z', 'second', 'exact', '2017-01-01T01:02:03Z'),
+    ],
+)
+def test_format_parsed_datetime(timestamp, precision, constraint, expected):
+    dttm = stix2.utils.parse_into_datetime(timestamp, precision, constraint)
+    assert stix2.utils.format_datetime(dttm) == expected
+
+
+def test_parse_datetime_invalid_date():
+    with pytest.raises(ValueError):
+        stix2.utils.parse_into_datetime('2017-02-30T00:00:00Z')
+
+
 @pytest.mark.parametrize(
     'data', [
         {"a": 1},
         '{"a": 1}',
+        b'{"a": 1}',
         StringIO(u'{"a": 1}'),
         [("a", 1)],
     ],
@@ -91,6 +115,11 @@ def test_get_dict_invalid(data):
         stix2.utils._get_dict(data)
 
 
+def test_get_dict_nan():
+    # Not strict JSON, but accepted by the stdlib decoder
+    assert math.isnan(stix2.utils._get_dict('{"a": NaN}')["a"])
+
+
 @pytest.mark.parametrize(
     'stix_id, type', [
         ('malware--d69c8146-ab35-4d50-8382-6fc80e641d43', 'malware'),
@@ -243,6 +272,25 @@ def test_iterate_over_values(dict_value, tuple_to_find, expected_index):
     assert stix2.serialization._find_property_in_seq(dict_value.values(), *tuple_to_find) == expected_index
 
 
+def test_property_indices():
+    grouping = stix2.v21.Grouping(
+        context="suspicious-activity",
+        object_refs=["identity--311b2d2d-f010-4473-83ec-1edf84858f4c"],
+        labels=["a", "b"],
+        external_references=[{"source_name": "src", "external_id": "ext"}],
+    )
+    indices = stix2.serialization._property_indices(grouping)
+
+    for key, value in grouping.items():
+        try:
+            idx = indices[(key, value)]
+        except TypeError:
+            continue
+        assert idx == stix2.serialization.find_property_index(grouping, key, value)
+
+    assert indices[("external_id", "ext")] == 1
+
+
 @pytest.mark.parametrize(
     "type_", [
         "attack-pattern",
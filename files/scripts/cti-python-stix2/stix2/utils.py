@@ -6,7 +6,10 @@ import enum
 import json
 import re
 
-import pytz
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import stix2.registry as mappings
 import stix2.version
@@ -20,6 +23,13 @@ PREFIX_21_REGEX = re.compile(r'^[a-z].*')
 
 _TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 _TIMESTAMP_FORMAT_FRAC = "%Y-%m-%dT%H:%M:%S.%fZ"
+# Canonical STIX timestamps (second, millisecond or microsecond precision),
+# which datetime.fromisoformat() parses directly on all supported Pythons.
+# Other strings strptime() accepts still go through the format strings above.
+_TIMESTAMP_ISO_REGEX = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}'
+    r'(?:\.[0-9]{3}|\.[0-9]{6})?Z',
+)
 
 
 class Precision(enum.Enum):
@@ -147,7 +157,7 @@ def deduplicate(stix_obj_list):
 
 def get_timestamp():
     """Return a STIX timestamp of the current date and time."""
-    return STIXdatetime.now(tz=pytz.UTC)
+    return STIXdatetime.now(tz=dt.timezone.utc)
 
 
 def format_datetime(dttm):
@@ -162,11 +172,17 @@ def format_datetime(dttm):
 
     """
 
+    # Timestamps parsed from a string that is already in the output format
+    # keep that string; see parse_into_datetime().
+    formatted = getattr(dttm, '_formatted', None)
+    if formatted is not None:
+        return formatted
+
     if dttm.tzinfo is None or dttm.tzinfo.utcoffset(dttm) is None:
         # dttm is timezone-naive; assume UTC
-        zoned = pytz.utc.localize(dttm)
+        zoned = dttm.replace(tzinfo=dt.timezone.utc)
     else:
-        zoned = dttm.astimezone(pytz.utc)
+        zoned = dttm.astimezone(dt.timezone.utc)
     ts = zoned.strftime('%Y-%m-%dT%H:%M:%S')
     precision = getattr(dttm, 'precision', Precision.ANY)
     precision_constraint = getattr(
@@ -212,6 +228,25 @@ def format_datetime(dttm):
     return ts
 
 
+def _frac_is_formatted(frac, precision, precision_constraint):
+    """
+    Return True if format_datetime() would emit the fractional seconds digits
+    ``frac`` of a canonical timestamp string unchanged, given the precision
+    settings the timestamp was parsed with.
+    """
+    if precision == Precision.MILLISECOND:
+        if precision_constraint == PrecisionConstraint.EXACT:
+            return len(frac) == 3
+        return len(frac) == 3 or (len(frac) == 6 and frac[-1] != "0")
+
+    if precision == Precision.SECOND and \
+            precision_constraint == PrecisionConstraint.EXACT:
+        return not frac
+
+    # Trailing zeros are stripped
+    return not frac or frac[-1] != "0"
+
+
 def parse_into_datetime(
     value, precision=Precision.ANY,
     precision_constraint=PrecisionConstraint.EXACT,
@@ -235,29 +270,40 @@ def parse_into_datetime(
     """
     precision = to_enum(precision, Precision)
     precision_constraint = to_enum(precision_constraint, PrecisionConstraint)
+    formatted = None
 
     if isinstance(value, dt.date):
         if hasattr(value, 'hour'):
             ts = value
         else:
             # Add a time component
-            ts = dt.datetime.combine(value, dt.time(0, 0, tzinfo=pytz.utc))
+            ts = dt.datetime.combine(value, dt.time(0, 0, tzinfo=dt.timezone.utc))
     else:
         # value isn't a date or datetime object so assume it's a string
-        fmt = _TIMESTAMP_FORMAT_FRAC if "." in value else _TIMESTAMP_FORMAT
+        if _TIMESTAMP_ISO_REGEX.fullmatch(value):
+            fmt = None
+        else:
+            fmt = _TIMESTAMP_FORMAT_FRAC if "." in value else _TIMESTAMP_FORMAT
         try:
-            parsed = dt.datetime.strptime(value, fmt)
+            if fmt is None:
+                parsed = dt.datetime.fromisoformat(value[:-1])
+            else:
+                parsed = dt.datetime.strptime(value, fmt)
         except (TypeError, ValueError):
             # Unknown format
             raise ValueError(
                 "must be a datetime object, date object, or "
                 "timestamp string in a recognizable format.",
             )
+        if fmt is None and _frac_is_formatted(
+            value[20:-1], precision, precision_constraint,
+        ):
+            formatted = value
         if parsed.tzinfo:
-            ts = parsed.astimezone(pytz.utc)
+            ts = parsed.astimezone(dt.timezone.utc)
         else:
             # Doesn't have timezone info in the string; assume UTC
-            ts = pytz.utc.localize(parsed)
+            ts = parsed.replace(tzinfo=dt.timezone.utc)
 
     # Ensure correct precision
     if precision == Precision.SECOND:
@@ -274,22 +320,45 @@ def parse_into_datetime(
 
     # else, precision == Precision.ANY: nothing for us to do.
 
-    return STIXdatetime(
+    ts = STIXdatetime(
         ts, precision=precision, precision_constraint=precision_constraint,
     )
+    if formatted is not None:
+        ts._formatted = formatted
+
+    return ts
+
+
+def _json_loads(data):
+    """Deserialize JSON text, using orjson when it is installed.
+
+    orjson is stricter than the standard library (e.g. it rejects NaN and
+    integers wider than 64 bits), so anything it refuses is handed to
+    ``json.loads`` to keep the accepted input and error messages unchanged.
+    """
+    if orjson is not None and isinstance(data, (str, bytes, bytearray)):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 def _get_dict(data):
     """Return data as a dictionary.
 
-    Input can be a dictionary, string, or file-like object.
+    Input can be a dictionary, string, bytes, or file-like object.
     """
-
-    if type(data) is dict:
+    # Exact type checks for the common inputs: a dict is returned untouched
+    # and JSON text goes straight to the decoder, without the fallbacks below.
+    data_type = type(data)
+    if data_type is dict:
         return data
+    elif data_type is str or data_type is bytes:
+        return _json_loads(data)
     else:
         try:
-            return json.loads(data)
+            return _json_loads(data)
         except TypeError:
             pass
         try:
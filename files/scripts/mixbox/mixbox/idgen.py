@@ -3,8 +3,10 @@
 
 """Methods for generating IDs"""
 
-import uuid
+import binascii
+import collections
 import contextlib
+import os
 
 from .namespaces import Namespace
 
@@ -15,6 +17,58 @@ __all__ = ['InvalidMethodError', 'IDGenerator', 'set_id_namespace',
            'set_id_method', 'create_id']
 
 
+#: Number of UUIDs generated from a single os.urandom() call.
+UUID_POOL_SIZE = 1024
+
+_uuid_pool = collections.deque()
+
+try:
+    # A forked child must never hand out UUIDs pooled by its parent.
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+    _check_pid = False
+except AttributeError:  # Python < 3.7
+    _check_pid = True
+
+_uuid_pool_pid = os.getpid()
+
+
+def _fill_uuid_pool():
+    raw = bytearray(os.urandom(16 * UUID_POOL_SIZE))
+
+    # Set the version (4) and variant (RFC 4122) bits, as uuid.uuid4() does.
+    for i in range(0, len(raw), 16):
+        raw[i + 6] = (raw[i + 6] & 0x0f) | 0x40
+        raw[i + 8] = (raw[i + 8] & 0x3f) | 0x80
+
+    hexed = str(binascii.hexlify(bytes(raw)).decode("ascii"))
+    _uuid_pool.extend(
+        "%s-%s-%s-%s-%s" % (
+            hexed[i:i + 8], hexed[i + 8:i + 12], hexed[i + 12:i + 16],
+            hexed[i + 16:i + 20], hexed[i + 20:i + 32]
+        )
+        for i in range(0, len(hexed), 32)
+    )
+
+
+def _uuid4():
+    """Return a random UUID string, like ``str(uuid.uuid4())``.
+
+    UUIDs are handed out from a pool which is filled UUID_POOL_SIZE at a
+    time, so the random bytes for many IDs come from one os.urandom() call.
+    """
+    global _uuid_pool_pid
+
+    if _check_pid and _uuid_pool_pid != os.getpid():
+        _uuid_pool.clear()
+        _uuid_pool_pid = os.getpid()
+
+    while True:
+        try:
+            return _uuid_pool.popleft()
+        except IndexError:
+            _fill_uuid_pool()
+
+
 class InvalidMethodError(ValueError):
 
     def __init__(self, method):
@@ -65,7 +119,7 @@ class IDGenerator(object):
         `method` is `METHOD_INT`.
         """
         if self.method == IDGenerator.METHOD_UUID:
-            id_ = str(uuid.uuid4())
+            id_ = _uuid4()
         elif self.method == IDGenerator.METHOD_INT:
             id_ = self.next_int
             self.next_int += 1
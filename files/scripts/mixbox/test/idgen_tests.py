@@ -2,6 +2,7 @@
 # See LICENSE.txt for complete terms.
 
 import unittest
+import uuid
 
 from mixbox.namespaces import Namespace
 from mixbox import idgen
@@ -19,6 +20,19 @@ class IDGeneratorMinimalTest(unittest.TestCase):
         self.assertNotEqual(idgen.create_id(), "")
 
 
+class UUIDPoolTest(unittest.TestCase):
+
+    def test_uuid4(self):
+        ids = [idgen._uuid4() for _ in range(idgen.UUID_POOL_SIZE + 1)]
+        self.assertEqual(len(ids), len(set(ids)))
+
+        for id_ in ids:
+            parsed = uuid.UUID(id_)
+            self.assertEqual(str(parsed), id_)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+
 class IDGeneratorTest(unittest.TestCase):
     """Tests for the cybox.utils.IDGenerator class."""
 
@@ -2,7 +2,9 @@
 # See LICENSE.txt for complete terms.
 
 import collections
+import importlib
 
+from mixbox.datautils import classproperty
 import mixbox.xml
 
 TypeInfo = collections.namedtuple("TypeInfo", ('ns', 'typename'))
@@ -94,3 +96,39 @@ def has_xsi_type(node):
 
     """
     return mixbox.xml.TAG_XSI_TYPE in node.attrib
+
+
+def lazy_binding(module, typename=None):
+    """Returns a class property for an Entity's ``_binding`` or
+    ``_binding_class`` attribute which imports the binding `module` on first
+    access rather than when the Entity class is defined.
+
+    The generated binding modules are large (``cybox_core`` imports the
+    bindings for every object type), and they are only needed once an Entity
+    is converted to or from a binding object.
+
+    Args:
+        module: The full name of the binding module, e.g.,
+            ``"cybox.bindings.cybox_core"``.
+        typename: The name of a binding class in `module`. If ``None``, the
+            property resolves to the module itself.
+
+    """
+    def getter(cls):
+        binding = importlib.import_module(module)
+        if typename is not None:
+            binding = getattr(binding, typename)
+
+        # Replace this property with the binding on the class which defines
+        # it, so the import happens once and later accesses (e.g., in every
+        # to_obj() call) are plain attribute lookups.
+        for klass in cls.__mro__:
+            for name, value in list(vars(klass).items()):
+                if value is prop:
+                    setattr(klass, name, binding)
+                    return binding
+
+        return binding
+
+    prop = classproperty(getter)
+    return prop
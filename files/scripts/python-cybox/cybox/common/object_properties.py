@@ -84,6 +84,68 @@ class ObjectProperties(entities.Entity):
     def add_related(self, related, relationship, inline=True):
         self.parent.add_related(related, relationship, inline)
 
+    @classmethod
+    def _dict_fields(cls):
+        """Return a tuple of (TypedField, key name, transformer, plain)
+        for each of this class's TypedFields.
+
+        ``plain`` is True for single-valued fields with no hooks and the
+        default ``_clean()``. Setting those to ``None`` only stores ``None``,
+        which from_dict() does directly for the (many) keys a dict leaves out.
+
+        Like ``typed_fields()``, this is computed once per class and stored on
+        the class.
+        """
+        klassdict = cls.__dict__
+
+        try:
+            return klassdict["_dict_fields_cache"]
+        except KeyError:
+            dict_fields = tuple(
+                (
+                    field,
+                    field.key_name,
+                    field.transformer,
+                    not field.multiple and
+                    not field.preset_hook and
+                    not field.postset_hook and
+                    type(field)._clean is fields.TypedField._clean,
+                )
+                for field in cls.typed_fields()
+            )
+            cls._dict_fields_cache = dict_fields
+        return dict_fields
+
+    @classmethod
+    def from_dict(cls, cls_dict):
+        if not isinstance(cls_dict, dict):
+            return super(ObjectProperties, cls).from_dict(cls_dict)
+
+        entity = cls()
+        entity_fields = entity._fields
+
+        for field, key_name, transformer, plain in cls._dict_fields():
+            val = cls_dict.get(key_name)
+
+            if val is None and plain:
+                entity_fields[field] = None
+                continue
+
+            if transformer:
+                if field.multiple:
+                    if val is not None:
+                        val = [transformer.from_dict(x) for x in val]
+                    else:
+                        val = []
+                else:
+                    val = transformer.from_dict(val)
+            elif field.multiple and not val:
+                val = []
+
+            field.__set__(entity, val)
+
+        return entity
+
     def to_obj(self, ns_info=None):
         obj = super(ObjectProperties, self).to_obj(ns_info=ns_info)
 
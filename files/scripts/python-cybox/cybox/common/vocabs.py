@@ -21,12 +21,17 @@ def validate_value(instance, value):
         return
     elif not allowed:
         return
-    elif value in allowed:
-        return
-    else:
-        error = "Value for vocab {instance.__class__} must be one of {allowed}. Received '{value}'"
-        error = error.format(**locals())
-        raise ValueError(error)
+
+    try:
+        if value in allowed:
+            return
+    except TypeError:
+        pass  # Unhashable (e.g., a list of values) so it can't be a term.
+
+    allowed = tuple(sorted(allowed))
+    error = "Value for vocab {instance.__class__} must be one of {allowed}. Received '{value}'"
+    error = error.format(**locals())
+    raise ValueError(error)
 
 
 class VocabFactory(entities.EntityFactory):
@@ -37,6 +42,11 @@ class VocabFactory(entities.EntityFactory):
         if not key:
             return VocabString
 
+        try:
+            return _VOCAB_MAP[key]
+        except KeyError:
+            pass
+
         for xsitype, klass in six.iteritems(_VOCAB_MAP):
             if key in xsitype:
                 return klass
@@ -90,7 +100,7 @@ class VocabString(PatternFieldGroup, entities.Entity):
     _namespace = 'http://cybox.mitre.org/default_vocabularies-2'
     # All subclasses should override this
     _XSI_TYPE = None
-    _ALLOWED_VALUES = ()
+    _ALLOWED_VALUES = frozenset()
     _binding = common_binding
     _binding_class = common_binding.ControlledVocabularyStringType
 
@@ -161,12 +171,12 @@ def register_vocab(cls):
     """Register a VocabString subclass.
 
     Also, calculate all the permitted values for class being decorated by
-    adding an ``_ALLOWED_VALUES`` tuple of all the values of class members
+    adding an ``_ALLOWED_VALUES`` frozenset of all the values of class members
     beginning with ``TERM_``.
     """
     _VOCAB_MAP[cls._XSI_TYPE] = cls  # noqa
 
-    cls._ALLOWED_VALUES = tuple(_get_terms(cls))
+    cls._ALLOWED_VALUES = frozenset(_get_terms(cls))
     return cls
 
 
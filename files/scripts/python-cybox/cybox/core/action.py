@@ -7,7 +7,7 @@ from mixbox import entities
 from mixbox import fields
 
 import cybox
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 from cybox.common import StructuredText, MeasureSource
 from cybox.common.vocabs import VocabField
 from cybox.core import ActionReference, AssociatedObject, Frequency
@@ -15,17 +15,19 @@ from cybox.core import ActionReference, AssociatedObject, Frequency
 from cybox.common.vocabs import ActionName, ActionType
 from cybox.common.vocabs import ActionArgumentName as ArgumentName
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
+
 
 class ActionAliases(entities.EntityList):
-    _binding = core_binding
-    _binding_class = core_binding.ActionAliasesType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionAliasesType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     action_alias = fields.TypedField("Action_Alias", cybox.Unicode, multiple=True)
 
 
 class ActionArgument(entities.Entity):
-    _binding = core_binding
-    _binding_class = core_binding.ActionArgumentType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionArgumentType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     argument_name = VocabField("Argument_Name", ArgumentName)
@@ -33,20 +35,20 @@ class ActionArgument(entities.Entity):
 
 
 class ActionArguments(entities.EntityList):
-    _binding_class = core_binding.ActionArgumentsType
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionArgumentsType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     action_argument = fields.TypedField("Action_Argument", ActionArgument, multiple=True)
 
 
 class AssociatedObjects(entities.EntityList):
-    _binding_class = core_binding.AssociatedObjectsType
+    _binding_class = lazy_binding(_CORE_BINDING, "AssociatedObjectsType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     associated_object = fields.TypedField("Associated_Object", AssociatedObject, multiple=True)
 
 
 class ActionRelationship(entities.Entity):
-    _binding = core_binding
-    _binding_class = _binding.ActionRelationshipType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionRelationshipType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     type = VocabField("Type", ActionType)
@@ -54,7 +56,7 @@ class ActionRelationship(entities.Entity):
 
 
 class ActionRelationships(entities.EntityList):
-    _binding_class = core_binding.ActionRelationshipsType
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionRelationshipsType")
     _binding_var = "Relationship"
     _contained_type = ActionRelationship
     _namespace = 'http://cybox.mitre.org/cybox-2'
@@ -62,8 +64,8 @@ class ActionRelationships(entities.EntityList):
 
 
 class Action(entities.Entity):
-    _binding = core_binding
-    _binding_class = core_binding.ActionType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     id_ = fields.TypedField("id")
@@ -84,8 +86,8 @@ class Action(entities.Entity):
 
 
 class Actions(entities.EntityList):
-    _binding = core_binding
-    _binding_class = core_binding.ActionsType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionsType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     action = fields.TypedField("Action", Action, multiple=True)
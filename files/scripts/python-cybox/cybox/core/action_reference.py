@@ -6,12 +6,14 @@
 from mixbox import entities
 from mixbox import fields
 
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
+
+_CORE_BINDING = "cybox.bindings.cybox_core"
 
 
 class ActionReference(entities.Entity):
-    _binding = core_binding
-    _binding_class = core_binding.ActionReferenceType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionReferenceType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     action_id = fields.TypedField("action_id")
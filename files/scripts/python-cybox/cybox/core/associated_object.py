@@ -3,19 +3,21 @@
 
 from cybox.core import Object
 from cybox.common.vocabs import VocabField
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 
 # backwards compatibility
 from cybox.common.vocabs import ActionObjectAssociationType as AssociationType  # noqa
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
+
 
 class AssociatedObject(Object):
     """The CybOX Associated Object element.
 
     Currently only supports the id, association_type and ObjectProperties properties
     """
-    _binding = core_binding
-    _binding_class = _binding.AssociatedObjectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "AssociatedObjectType")
 
     association_type = VocabField("Association_Type", AssociationType)
 
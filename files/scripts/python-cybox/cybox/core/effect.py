@@ -4,9 +4,11 @@
 from mixbox import entities, fields
 
 import cybox
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 from cybox.common import DataSegment
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
+
 
 class DefinedEffectFactory(entities.EntityFactory):
     @classmethod
@@ -15,8 +17,8 @@ class DefinedEffectFactory(entities.EntityFactory):
 
 
 class DefinedEffect(entities.Entity):
-    _binding = core_binding
-    _binding_class = core_binding.DefinedEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "DefinedEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = None    # overridden by subclasses
 
@@ -46,8 +48,8 @@ class DefinedEffect(entities.Entity):
 
 @cybox.register_extension
 class StateChangeEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.StateChangeEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "StateChangeEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:StateChangeEffectType"
 
@@ -57,8 +59,8 @@ class StateChangeEffect(DefinedEffect):
 
 @cybox.register_extension
 class DataReadEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.DataReadEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "DataReadEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:DataReadEffectType"
 
@@ -67,8 +69,8 @@ class DataReadEffect(DefinedEffect):
 
 @cybox.register_extension
 class DataWrittenEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.DataWrittenEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "DataWrittenEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:DataWrittenEffectType"
 
@@ -77,8 +79,8 @@ class DataWrittenEffect(DefinedEffect):
 
 @cybox.register_extension
 class DataSentEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.DataSentEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "DataSentEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:DataSentEffectType"
 
@@ -87,8 +89,8 @@ class DataSentEffect(DefinedEffect):
 
 @cybox.register_extension
 class DataReceivedEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.DataReceivedEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "DataReceivedEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:DataReceivedEffectType"
 
@@ -97,8 +99,8 @@ class DataReceivedEffect(DefinedEffect):
 
 @cybox.register_extension
 class PropertyReadEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.PropertyReadEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "PropertyReadEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:PropertyReadEffectType"
 
@@ -107,8 +109,8 @@ class PropertyReadEffect(DefinedEffect):
 
 
 class Properties(entities.Entity):
-    _binding = core_binding
-    _binding_class = core_binding.PropertiesType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "PropertiesType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     property_ = fields.TypedField("Property", multiple=True)
@@ -116,8 +118,8 @@ class Properties(entities.Entity):
 
 @cybox.register_extension
 class PropertiesEnumeratedEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.PropertiesEnumeratedEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "PropertiesEnumeratedEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:PropertiesEnumeratedEffectType"
 
@@ -125,8 +127,8 @@ class PropertiesEnumeratedEffect(DefinedEffect):
 
 
 class Values(entities.Entity):
-    _binding = core_binding
-    _binding_class = core_binding.ValuesType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ValuesType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     value = fields.TypedField("Value", multiple=True)
@@ -134,8 +136,8 @@ class Values(entities.Entity):
 
 @cybox.register_extension
 class ValuesEnumeratedEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.ValuesEnumeratedEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ValuesEnumeratedEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:ValuesEnumeratedEffectType"
 
@@ -144,8 +146,8 @@ class ValuesEnumeratedEffect(DefinedEffect):
 
 @cybox.register_extension
 class SendControlCodeEffect(DefinedEffect):
-    _binding = core_binding
-    _binding_class = core_binding.SendControlCodeEffectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "SendControlCodeEffectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _XSI_TYPE = "cybox:SendControlCodeEffectType"
 
@@ -4,15 +4,17 @@
 from mixbox import entities
 from mixbox import fields
 
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 from cybox.common import StructuredText, MeasureSource, Location
 from cybox.common.vocabs import EventType, VocabField
 from cybox.core import Actions, Frequency
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
+
 
 class Event(entities.Entity):
-    _binding = core_binding
-    _binding_class = core_binding.EventType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "EventType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     id_ = fields.TypedField("id")
@@ -5,7 +5,7 @@ from mixbox import entities, fields, idgen
 
 import cybox
 import cybox.utils
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 from cybox.common import MeasureSource, StructuredText
 from cybox.common.location import Location, LocationFactory
 from cybox.common.object_properties import ObjectPropertiesFactory, ObjectProperties
@@ -13,6 +13,7 @@ from cybox.common.vocabs import VocabField
 from cybox.common.vocabs import ObjectRelationship as Relationship
 from cybox.core.effect import DefinedEffectFactory
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
 _EXTERNAL_CLASSES = {}  # Maps xsi:type values to binding
 
 
@@ -30,15 +31,13 @@ def add_external_class(klass, xsi_type):
 
 
 class ExternalTypeFactory(entities.EntityFactory):
+    @classmethod
     def entity_class(cls, key):
         return _EXTERNAL_CLASSES[key]
 
 
 def _modify_properties_parent(instance, value=None):
-    if isinstance(instance, RelatedObject) and not instance._inline:
-        return
-    if instance.properties:
-        instance.properties.parent = instance
+    instance._set_properties_parent(value)
 
 
 def _cache_object(instance, value=None):
@@ -70,8 +69,8 @@ class Object(entities.Entity):
         met (e.g. %30 of memory consumed by cache mechanism).
 
     """
-    _binding = core_binding
-    _binding_class = _binding.ObjectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ObjectType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     id_ = fields.IdField("id", postset_hook=_cache_object)
@@ -107,6 +106,12 @@ class Object(entities.Entity):
         else:
             return super(Object, self).__repr__()
 
+    def _set_properties_parent(self, properties):
+        # Called whenever ``properties`` is set; subclasses override this
+        # rather than the field hook testing for them.
+        if properties:
+            properties.parent = self
+
     def add_related(self, related, relationship, inline=True):
         if not isinstance(related, ObjectProperties):
             raise ValueError("Must be a ObjectProperties")
@@ -115,8 +120,8 @@ class Object(entities.Entity):
 
 
 class RelatedObject(Object):
-    _binding = core_binding
-    _binding_class = _binding.RelatedObjectType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "RelatedObjectType")
 
     relationship = VocabField("Relationship", Relationship)
 
@@ -134,12 +139,28 @@ class RelatedObject(Object):
     def __str__(self):
         return "Related: " + super(RelatedObject, self).__str__()
 
+    def _set_properties_parent(self, properties):
+        # Non-inline properties belong to the Object they were taken from.
+        if self._inline:
+            super(RelatedObject, self)._set_properties_parent(properties)
+
     #TODO: make this a property somehow
     def get_properties(self):
+        """Return the properties of this related object.
+
+        If the object is not inline, the Object its idref points to is looked
+        up in the object cache. That Object is kept on this instance along
+        with the idref it was found by, and is looked up again only once
+        ``idref`` changes.
+        """
         if self.properties:
             return self.properties
         elif self.idref:
-            return cybox.utils.cache_get(self.idref).properties
+            resolved = getattr(self, "_resolved", None)
+            if resolved is None or resolved[0] != self.idref:
+                resolved = (self.idref, cybox.utils.cache_get(self.idref))
+                self._resolved = resolved
+            return resolved[1].properties
         else:
             return None
 
@@ -192,16 +213,21 @@ class RelatedObject(Object):
 
 class RelatedObjects(entities.EntityList):
     _namespace = "http://cybox.mitre.org/cybox-2"
-    _binding = core_binding
-    _binding_class = _binding.RelatedObjectsType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "RelatedObjectsType")
 
     related_object = fields.TypedField("Related_Object", RelatedObject, multiple=True)
 
+    def __iter__(self):
+        # The default Sequence iterator indexes one item at a time, resolving
+        # the backing list through the multiple TypedField on every step.
+        return iter(self._inner)
+
 
 class DomainSpecificObjectProperties(entities.Entity):
     """The Cybox DomainSpecificObjectProperties base class."""
-    _binding = core_binding
-    _binding_class = _binding.DomainSpecificObjectPropertiesType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "DomainSpecificObjectPropertiesType")
 
     # Override in subclass
     _XSI_TYPE = None
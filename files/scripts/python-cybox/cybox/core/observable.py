@@ -4,10 +4,12 @@
 from mixbox import entities, fields, idgen
 
 from cybox import Unicode
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 from cybox.common import MeasureSource, ObjectProperties, StructuredText
 from cybox.core import Object, Event
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
+
 
 def validate_operator(instance, value):
     allowed = ObservableComposition.OPERATORS
@@ -53,8 +55,8 @@ def validate_observable_composition(instance, value):
 
 
 class Keywords(entities.EntityList):
-    _binding = core_binding
-    _binding_class = core_binding.KeywordsType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "KeywordsType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     keyword = fields.TypedField("Keyword", Unicode, multiple=True)
@@ -63,8 +65,8 @@ class Keywords(entities.EntityList):
 class Observable(entities.Entity):
     """A single Observable.
     """
-    _binding = core_binding
-    _binding_class = _binding.ObservableType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ObservableType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     id_ = fields.IdField("id")
@@ -126,8 +128,8 @@ class Observable(entities.Entity):
 class Observables(entities.EntityList):
     """The root CybOX Observables object.
     """
-    _binding = core_binding
-    _binding_class = _binding.ObservablesType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ObservablesType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     cybox_major_version = fields.TypedField("cybox_major_version")
@@ -164,8 +166,8 @@ class ObservableComposition(entities.EntityList):
     CybOX Observables. The combinatorial behavior is derived from the operator
     property."""
 
-    _binding = core_binding
-    _binding_class = _binding.ObservableCompositionType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ObservableCompositionType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     OPERATOR_AND = 'AND'
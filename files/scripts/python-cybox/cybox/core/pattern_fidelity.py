@@ -4,31 +4,33 @@
 from mixbox import entities
 from mixbox import fields
 
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 from cybox.common import StructuredText
 from cybox.core.observable import Observables
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
+
 
 class ObfuscationTechnique(entities.Entity):
-    _binding = core_binding
+    _binding = lazy_binding(_CORE_BINDING)
     _namespace = 'http://cybox.mitre.org/cybox-2'
-    _binding_class = core_binding.ObfuscationTechniqueType
+    _binding_class = lazy_binding(_CORE_BINDING, "ObfuscationTechniqueType")
 
     description = fields.TypedField("Description", StructuredText)
     observables = fields.TypedField("Observables", Observables)
 
 
 class ObfuscationTechniques(entities.EntityList):
-    _binding = core_binding
+    _binding = lazy_binding(_CORE_BINDING)
     _namespace = 'http://cybox.mitre.org/cybox-2'
-    _binding_class = core_binding.ObfuscationTechniquesType
+    _binding_class = lazy_binding(_CORE_BINDING, "ObfuscationTechniquesType")
     obfuscation_technique = fields.TypedField("Obfuscation_Technique", ObfuscationTechnique, multiple=True)
 
 
 class PatternFidelity(entities.Entity):
-    _binding = core_binding
+    _binding = lazy_binding(_CORE_BINDING)
     _namespace = 'http://cybox.mitre.org/cybox-2'
-    _binding_class = core_binding.PatternFidelityType
+    _binding_class = lazy_binding(_CORE_BINDING, "PatternFidelityType")
 
     noisiness = fields.TypedField("Noisiness")
     ease_of_evasion = fields.TypedField("Ease_of_Evasion")
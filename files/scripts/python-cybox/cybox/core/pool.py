@@ -3,46 +3,48 @@
 
 from mixbox import entities, fields
 
-import cybox.bindings.cybox_core as core_binding
+from cybox.bindings import lazy_binding
 from cybox.common import Property
 from cybox.core import Action, Event, Object
 
+_CORE_BINDING = "cybox.bindings.cybox_core"
+
 
 class EventPool(entities.Entity):
-    _binding = core_binding
-    _binding_class = _binding.EventPoolType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "EventPoolType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     events = fields.TypedField("Event", Event, multiple=True, key_name="events")
 
 
 class ActionPool(entities.Entity):
-    _binding = core_binding
-    _binding_class = _binding.ActionPoolType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ActionPoolType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     actions = fields.TypedField("Action", Action, multiple=True, key_name="actions")
 
 
 class ObjectPool(entities.Entity):
-    _binding = core_binding
-    _binding_class = _binding.ObjectPoolType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "ObjectPoolType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     objects = fields.TypedField("Object", Object, multiple=True, key_name="objects")
 
 
 class PropertyPool(entities.Entity):
-    _binding = core_binding
-    _binding_class = _binding.PropertyPoolType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "PropertyPoolType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     properties = fields.TypedField("Property", Property, multiple=True, key_name="properties")
 
 
 class Pools(entities.Entity):
-    _binding = core_binding
-    _binding_class = _binding.PoolsType
+    _binding = lazy_binding(_CORE_BINDING)
+    _binding_class = lazy_binding(_CORE_BINDING, "PoolsType")
     _namespace = 'http://cybox.mitre.org/cybox-2'
 
     event_pool = fields.TypedField("Event_Pool", EventPool)
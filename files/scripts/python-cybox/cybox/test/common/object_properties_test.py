@@ -3,6 +3,7 @@
 
 import unittest
 
+from mixbox import entities
 from mixbox.vendor.six import u
 
 from cybox.common import ObjectProperties, Property
@@ -40,6 +41,14 @@ class TestObjectProperties(EntityTestCase, unittest.TestCase):
 
         self.assertRaises(ValueError, ObjectPropertiesFactory.from_dict, d)
 
+    def test_from_dict_matches_entity(self):
+        # The per-class from_dict() must build the same fields as the
+        # generic Entity.from_dict().
+        obj = Address.from_dict(self._full_dict)
+        generic = entities.Entity.from_dict.__func__(Address, self._full_dict)
+
+        self.assertEqual(generic._fields, obj._fields)
+
     def test_detect_address(self):
         d = {'xsi:type': Address._XSI_TYPE}
 
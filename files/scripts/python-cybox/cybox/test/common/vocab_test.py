@@ -158,6 +158,15 @@ class HashNameTests(unittest.TestCase):
     def test_hash_name_vocabulary(self):
         # Test for using the @register_vocab decorator.
         self.assertEqual(8, len(HashNameVocab._ALLOWED_VALUES))
+        self.assertTrue(isinstance(HashNameVocab._ALLOWED_VALUES, frozenset))
+
+    def test_unhashable_value(self):
+        self.assertRaises(ValueError, HashNameVocab, [HashNameVocab.TERM_MD5])
+
+    def test_factory_exact_xsi_type(self):
+        from cybox.common.vocabs import VocabFactory
+        klass = VocabFactory.entity_class(HashNameVocab._XSI_TYPE)
+        self.assertTrue(klass is HashNameVocab)
 
 
 if __name__ == "__main__":
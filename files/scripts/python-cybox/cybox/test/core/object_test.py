@@ -2,10 +2,15 @@
 # See LICENSE.txt for complete terms.
 
 import logging
+import sys
+import types
 import unittest
 
 from mixbox.vendor.six import u
+from cybox.bindings import lazy_binding
 from cybox.core import Object, Observables, RelatedObject
+from cybox.core.object import (
+    DomainSpecificObjectProperties, ExternalTypeFactory, add_external_class)
 from cybox.objects.address_object import Address
 from cybox.objects.uri_object import URI
 from cybox.test import EntityTestCase, round_trip, round_trip_dict
@@ -40,6 +45,30 @@ class ObjectTest(EntityTestCase, unittest.TestCase):
         o = Object(a)
         self.assertTrue("Address" in o.id_)
 
+    def test_lazy_binding(self):
+        import cybox.bindings.cybox_core as core_binding
+
+        o = Object()
+        self.assertTrue(Object._binding is core_binding)
+        self.assertTrue(o._binding_class is core_binding.ObjectType)
+        self.assertTrue(RelatedObject._binding_class is core_binding.RelatedObjectType)
+
+    def test_lazy_binding_resolved_once(self):
+        module = types.ModuleType("cybox_test_fake_binding")
+        module.FakeType = object()
+        sys.modules[module.__name__] = module
+
+        class Fake(object):
+            _binding_class = lazy_binding(module.__name__, "FakeType")
+
+        try:
+            self.assertTrue(Fake._binding_class is module.FakeType)
+        finally:
+            del sys.modules[module.__name__]
+
+        # No longer importable, so this only works if it isn't re-imported.
+        self.assertTrue(Fake._binding_class is module.FakeType)
+
     def test_round_trip(self):
         o = Object()
         o.idref = "example:a1"
@@ -49,6 +78,23 @@ class ObjectTest(EntityTestCase, unittest.TestCase):
         self.assertEqual(o.to_dict(), o2.to_dict())
 
 
+class ExternalTypeFactoryTest(unittest.TestCase):
+
+    def test_entity_class(self):
+        class Foo(DomainSpecificObjectProperties):
+            _XSI_TYPE = "FooType"
+
+        add_external_class(Foo, "foo:FooType")
+        self.assertTrue(ExternalTypeFactory.entity_class("foo:FooType") is Foo)
+
+    def test_unicode_xsi_type(self):
+        class Bar(DomainSpecificObjectProperties):
+            _XSI_TYPE = "BarType"
+
+        add_external_class(Bar, u("bar:BarType"))
+        self.assertTrue(ExternalTypeFactory.entity_class("bar:BarType") is Bar)
+
+
 class RelatedObjectTest(EntityTestCase, unittest.TestCase):
     klass = RelatedObject
 
@@ -123,6 +169,29 @@ class RelatedObjectTest(EntityTestCase, unittest.TestCase):
         rel_obj = o2.observables[0].object_.related_objects[0]
         self.assertRaises(CacheMiss, rel_obj.get_properties)
 
+    def test_iter_related_objects(self):
+        self.domain.add_related(self.ip, "Resolved_To", inline=True)
+        self.domain.add_related(self.ip, "Resolved_To", inline=False)
+        related = self.domain.parent.related_objects
+
+        self.assertEqual([related[0], related[1]], list(related))
+        self.assertEqual([r.to_dict() for r in related], related.to_list())
+
+    def test_get_properties_by_idref(self):
+        self.domain.add_related(self.ip, "Resolved_To", inline=False)
+        rel_obj = self.domain.parent.related_objects[0]
+
+        self.assertTrue(rel_obj.get_properties() is self.ip)
+        self.assertTrue(rel_obj.get_properties() is self.ip)
+
+        rel_obj.idref = self.domain.parent.id_
+        self.assertTrue(rel_obj.get_properties() is self.domain)
+
+        # The properties come from the current state of the target Object.
+        ip2 = Address("192.168.1.2", Address.CAT_IPV4)
+        self.domain.parent.properties = ip2
+        self.assertTrue(rel_obj.get_properties() is ip2)
+
     def test_relationship_standard_xsitype(self):
         d = {
             'id': "example:Object-1",